@@ -1,14 +1,22 @@
 """
 Comprehensive QA Automation Validation Suite
 Tests all user, admin, and system flows across the E-Commerce Platform
+
+Requires: httpx, orjson (optional: h2 for HTTP/2, uvloop for a faster event loop)
 """
+import asyncio
+import contextlib
 import httpx
-import json
+import importlib.util
+import orjson
+import sys
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+from types import MappingProxyType
 
 # Configuration
 SERVICE_A_URL = "http://localhost:8001"
@@ -16,35 +24,103 @@ SERVICE_B_URL = "http://localhost:8002"
 SERVICE_C_URL = "http://localhost:8010"
 FRONTEND_URL = "http://localhost:5173"
 
+SERVICE_URLS = {
+    "A": SERVICE_A_URL,
+    "B": SERVICE_B_URL,
+    "C": SERVICE_C_URL
+}
+
 TIMEOUT = 30.0
 
+# Connection pooling - one persistent (multiplexed when h2 is installed)
+# connection per service is reused across every flow
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None  # pip install "httpx[http2]"
+# Each service gets its own connection budget so a burst against one host
+# can't starve the others; Service C only receives the odd notification
+SERVICE_POOL_LIMITS = {
+    "A": httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=75.0),
+    "B": httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=75.0),
+    "C": httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=75.0)
+}
+# libuv-based event loop - not available on Windows
+UVLOOP_ENABLED = sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+# Cap on in-flight requests per service - keep at or below the uvicorn worker count
+MAX_IN_FLIGHT_PER_SERVICE = 10
+
+# Transient failures - connection errors are retried by the transport, these
+# statuses by make_request, and only for methods that are safe to repeat
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.1  # seconds, doubled on each attempt
+RETRY_STATUSES = frozenset({429, 502, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+INVALID_AUTH_HEADERS = {"Authorization": "Bearer invalid.jwt.token"}
+
 # Demo accounts
 ADMIN_EMAIL = "admin@example.com"
 ADMIN_PASSWORD = "Admin@123"
 CUSTOMER_EMAIL = "alice@example.com"
 CUSTOMER_PASSWORD = "Alice@123"
 
+# Latency histogram - bucket b counts responses under 2**b microseconds
+LATENCY_BUCKETS = 32
+
+
+def latency_percentile(hist: List[int], q: float) -> Optional[float]:
+    """Estimate the q-th latency quantile (seconds) from a log2 histogram"""
+    count = sum(hist)
+    if not count:
+        return None
+    rank = q * count
+    seen = 0
+    for bucket, hits in enumerate(hist):
+        seen += hits
+        if seen >= rank:
+            return (1 << bucket) / 1e6
+    return (1 << (LATENCY_BUCKETS - 1)) / 1e6
+
 
-class TestResult(Enum):
-    PASS = "✅"
-    FAIL = "❌"
-    WARNING = "⚠️"
-    SKIPPED = "⏭️"
+class TestResult(IntEnum):
+    PASS = 1
+    FAIL = 2
+    WARNING = 3
+    SKIPPED = 4
 
 
-@dataclass
+RESULT_SYMBOL = {
+    TestResult.PASS: "✅",
+    TestResult.FAIL: "❌",
+    TestResult.WARNING: "⚠️",
+    TestResult.SKIPPED: "⏭️"
+}
+
+
+@dataclass(slots=True)
 class APICall:
     """Represents an API call for logging"""
     url: str
     method: str
     payload: Optional[Dict] = None
     response_code: Optional[int] = None
-    response_time: Optional[float] = None
+    response_time_ns: Optional[int] = None
     service: Optional[str] = None
     error: Optional[str] = None
+    # Raw body of a successful response; decoded only when a flow reads .data
+    content: bytes = b""
+    _data: Any = field(default=None, repr=False)
+    _parsed: bool = field(default=False, repr=False)
+    
+    @property
+    def data(self) -> Any:
+        """JSON body, parsed with orjson on first access"""
+        if not self._parsed:
+            self._data = orjson.loads(self.content) if self.content else None
+            self._parsed = True
+        return self._data
 
 
-@dataclass
+@dataclass(slots=True)
 class TestFlow:
     """Represents a test flow"""
     name: str
@@ -55,25 +131,29 @@ class TestFlow:
     fix_applied: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class QAReport:
     """Comprehensive QA Report"""
     flows: List[TestFlow] = field(default_factory=list)
     api_health: Dict[str, Dict] = field(default_factory=dict)
-    fixes_applied: List[Dict] = field(default_factory=list)
-    observations: List[str] = field(default_factory=list)
+    fixes_applied: Sequence[Mapping[str, str]] = ()
+    observations: Sequence[str] = ()
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
+    # Monotonic clock for the elapsed time; the datetimes are wall-clock stamps only
+    start_ns: int = field(default_factory=time.perf_counter_ns)
+    end_ns: Optional[int] = None
     
     def add_flow(self, flow: TestFlow):
         self.flows.append(flow)
     
     def get_summary(self) -> Dict:
         total = len(self.flows)
-        passed = sum(1 for f in self.flows if f.result == TestResult.PASS)
-        failed = sum(1 for f in self.flows if f.result == TestResult.FAIL)
-        warnings = sum(1 for f in self.flows if f.result == TestResult.WARNING)
-        skipped = sum(1 for f in self.flows if f.result == TestResult.SKIPPED)
+        counts = Counter(f.result for f in self.flows)
+        passed = counts[TestResult.PASS]
+        failed = counts[TestResult.FAIL]
+        warnings = counts[TestResult.WARNING]
+        skipped = counts[TestResult.SKIPPED]
         
         return {
             "total": total,
@@ -85,22 +165,159 @@ class QAReport:
         }
 
 
+# Findings from the manual review, reported on every run
+_FIXES_APPLIED: Tuple[Mapping[str, str], ...] = (
+    MappingProxyType({
+        "file": "frontend/src/context/AuthContext.tsx",
+        "lines": "25-26, 60-64, 47-51",
+        "description": "Fixed API endpoint URLs and token field handling",
+        "before": "VITE_USER_SERVICE_URL → http://localhost:4001, /auth/register, token field",
+        "after": "VITE_SERVICE_A_URL → http://localhost:8001, /auth/signup, access_token field",
+        "status": "✅ Fixed"
+    }),
+    MappingProxyType({
+        "file": "frontend/src/pages/Products.tsx",
+        "lines": "16-17, 26-27",
+        "description": "Fixed product service URL and endpoint path",
+        "before": "VITE_PRODUCT_SERVICE_URL → http://localhost:4002, /products, response.data.products",
+        "after": "VITE_SERVICE_B_URL → http://localhost:8002, /catalog/products, response.data",
+        "status": "✅ Fixed"
+    }),
+)
+_OBSERVATIONS: Tuple[str, ...] = (
+    "Service B admin endpoints (catalog) do not require authentication - this may be intentional for MVP",
+    "Service A admin endpoints properly require admin role validation",
+    "Token response uses 'access_token' field in backend, handled flexibly in frontend",
+    "Cart price fetching from Service B is noted as TODO in Service A cart.py (line 57-58)",
+    "Stripe integration requires valid API keys in environment variables",
+    "Notification service (Service C) properly handles events asynchronously",
+    "Cross-service inventory reservation (two-phase commit) properly implemented",
+)
+
+
+def render_fixes(fixes: Sequence[Mapping[str, str]]) -> str:
+    """Format the FIXES APPLIED report section"""
+    out = ["\n" + "=" * 80, "🔧 FIXES APPLIED", "=" * 80]
+    for fix in fixes:
+        out.append(f"\n{fix['file']}:{fix['lines']}")
+        out.append(f"   {fix['description']}")
+        out.append(f"   {fix['before']} → {fix['after']}")
+        out.append(f"   Status: {fix['status']}")
+    return "\n".join(out)
+
+
+def render_observations(observations: Sequence[str]) -> str:
+    """Format the OBSERVATIONS & RECOMMENDATIONS report section"""
+    out = ["\n" + "=" * 80, "💡 OBSERVATIONS & RECOMMENDATIONS", "=" * 80]
+    out.extend(f"   • {obs}" for obs in observations)
+    return "\n".join(out)
+
+
+_FIXES_APPLIED_RENDERED = render_fixes(_FIXES_APPLIED)
+_OBSERVATIONS_RENDERED = render_observations(_OBSERVATIONS)
+
+
+@contextlib.contextmanager
+def flow_guard(flow: TestFlow):
+    """Mark the flow as failed if anything inside the block raises"""
+    try:
+        yield
+    except Exception as e:
+        flow.result = TestResult.FAIL
+        flow.root_cause = str(e)
+
+
+def fail_flow(flow: TestFlow, call: APICall):
+    """Mark the flow as failed using the error recorded on the call"""
+    flow.result = TestResult.FAIL
+    flow.root_cause = call.error or f"Status {call.response_code}"
+
+
+PathSpec = Union[str, Callable[["QAAutomationEngine"], str]]
+PayloadSpec = Union[None, Dict, Callable[["QAAutomationEngine"], Dict]]
+
+
+@dataclass(slots=True, frozen=True)
+class FlowSpec:
+    """Declarative description of a test flow
+    
+    Single-request flows are fully described by the fields below and run by
+    QAAutomationEngine.run_flow; multi-step flows name a bespoke engine
+    coroutine in `runner` instead.
+    """
+    name: str
+    service: str
+    method: str = "GET"
+    path: PathSpec = ""
+    payload: PayloadSpec = None
+    expect: int = 200
+    auth: Optional[str] = None  # "customer", "admin" or "invalid"
+    requires: Tuple[str, ...] = ()  # engine attributes that must be set, else SKIPPED
+    skip_reason: str = ""
+    needs: Tuple[str, ...] = ()  # flows that must finish before this one starts
+    success: Callable[[APICall], bool] = lambda call: True
+    capture: Optional[Callable[["QAAutomationEngine", Any], None]] = None
+    mismatch: TestResult = TestResult.WARNING  # result when `success` rejects the body
+    mismatch_cause: str = ""
+    on_error: TestResult = TestResult.FAIL  # result when the status is not `expect`
+    error_cause: str = ""
+    runner: Optional[str] = None
+    report: bool = True
+
+
 class QAAutomationEngine:
     """Main QA Automation Engine"""
     
     def __init__(self):
         self.report = QAReport()
-        self.client = httpx.Client(timeout=TIMEOUT, follow_redirects=True)
+        # One client per service so each keeps its own warm connection pool
+        self.clients: Dict[str, httpx.AsyncClient] = {
+            service: httpx.AsyncClient(
+                base_url=base_url,
+                timeout=TIMEOUT,
+                follow_redirects=True,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=HTTP2_ENABLED, limits=SERVICE_POOL_LIMITS[service], retries=MAX_RETRIES
+                )
+            )
+            for service, base_url in SERVICE_URLS.items()
+        }
+        self.semaphores: Dict[str, asyncio.Semaphore] = {
+            service: asyncio.Semaphore(MAX_IN_FLIGHT_PER_SERVICE) for service in SERVICE_URLS
+        }
         self.customer_token: Optional[str] = None
         self.admin_token: Optional[str] = None
+        # Auth headers are built once per login and shared by every request
+        self._hdr_customer: Optional[Dict[str, str]] = None
+        self._hdr_admin: Optional[Dict[str, str]] = None
         self.customer_user_id: Optional[int] = None
         self.admin_user_id: Optional[int] = None
         self.test_address_id: Optional[int] = None
+        self._checkout_payload: Optional[Dict[str, int]] = None
         self.test_product_id: Optional[int] = None
+        # Parsed product detail by ID - fetched at most once per run
+        self._product_cache: Dict[int, Dict] = {}
         self.test_category_id: Optional[int] = None
         self.test_order_id: Optional[int] = None
         self.test_cart_item_id: Optional[int] = None
+        # Each prerequisite runs at most once; later callers await the same task
+        self._once: Dict[str, asyncio.Task] = {}
         
+    async def __aenter__(self) -> "QAAutomationEngine":
+        await self.warmup()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def warmup(self):
+        """Open a pooled connection to every service before the first flow runs"""
+        # Not logged as API calls - a service that is down surfaces in the flows
+        await asyncio.gather(
+            *(client.get("/health") for client in self.clients.values()),
+            return_exceptions=True
+        )
+    
     def log_api_call(self, call: APICall, flow: TestFlow):
         """Log API call to flow"""
         flow.apis.append(call)
@@ -110,8 +327,9 @@ class QAAutomationEngine:
                     "total": 0,
                     "success": 0,
                     "failures": 0,
-                    "avg_latency": 0,
-                    "latencies": []
+                    "timed": 0,
+                    "sum_latency_ns": 0,
+                    "hist": [0] * LATENCY_BUCKETS
                 }
             health = self.report.api_health[call.service]
             health["total"] += 1
@@ -119,432 +337,182 @@ class QAAutomationEngine:
                 health["success"] += 1
             else:
                 health["failures"] += 1
-            if call.response_time:
-                health["latencies"].append(call.response_time)
-                health["avg_latency"] = sum(health["latencies"]) / len(health["latencies"])
+            if call.response_time_ns:
+                # Running sums only - the mean is derived once in generate_report
+                health["timed"] += 1
+                health["sum_latency_ns"] += call.response_time_ns
+                bucket = (call.response_time_ns // 1000).bit_length()
+                health["hist"][min(LATENCY_BUCKETS - 1, bucket)] += 1
     
-    def make_request(
+    async def make_request(
         self, 
         method: str, 
-        url: str, 
-        token: Optional[str] = None,
+        path: str, 
+        headers: Optional[Dict[str, str]] = None,
         json_data: Optional[Dict] = None,
-        service: Optional[str] = None
-    ) -> Tuple[Optional[httpx.Response], APICall]:
-        """Make HTTP request with logging"""
-        headers = {"Content-Type": "application/json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        
-        call = APICall(url=url, method=method, payload=json_data, service=service)
+        service: str = "A"
+    ) -> APICall:
+        """Make HTTP request against a service-relative path with logging"""
+        # Callers pass prebuilt auth headers; bodies are encoded with orjson
+        content = None
+        if json_data is not None:
+            content = orjson.dumps(json_data)
+            headers = {**headers, **JSON_HEADERS} if headers else JSON_HEADERS
+        call = APICall(url=path, method=method, payload=json_data, service=service)
         
         try:
-            start_time = time.time()
-            response = self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=json_data
-            )
-            call.response_time = time.time() - start_time
+            async with self.semaphores[service], asyncio.timeout(TIMEOUT):
+                start_ns = time.perf_counter_ns()
+                for attempt in range(MAX_RETRIES + 1):
+                    response = await self.clients[service].request(
+                        method=method,
+                        url=path,
+                        headers=headers,
+                        content=content
+                    )
+                    if (
+                        attempt == MAX_RETRIES
+                        or response.status_code not in RETRY_STATUSES
+                        or method not in IDEMPOTENT_METHODS
+                    ):
+                        break
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                call.response_time_ns = time.perf_counter_ns() - start_ns
             call.response_code = response.status_code
             
-            if response.status_code >= 400:
+            # Successful bodies are kept raw - only flows that inspect them pay for parsing
+            if response.status_code < 400:
+                call.content = response.content
+            else:
                 try:
-                    call.error = response.json().get("detail", response.text[:100])
-                except:
+                    body = orjson.loads(response.content)
+                except (ValueError, orjson.JSONDecodeError):
+                    body = None
+                if isinstance(body, dict) and "detail" in body:
+                    call.error = body["detail"]
+                else:
                     call.error = response.text[:100]
             
+        except TimeoutError:
+            call.error = f"Timed out after {TIMEOUT}s"
+            call.response_code = 500
         except Exception as e:
             call.error = str(e)
             call.response_code = 500
         
-        return response if 'response' in locals() else None, call
+        return call
     
-    # ==================== AUTHENTICATION FLOWS ====================
+    async def _get(self, path: str, service: str, headers: Optional[Dict[str, str]] = None) -> APICall:
+        return await self.make_request("GET", path, headers=headers, service=service)
     
-    def test_user_registration(self) -> TestFlow:
-        """Test user registration flow"""
-        flow = TestFlow(name="User Registration", service="A")
-        
-        try:
-            # Generate unique email
-            timestamp = int(time.time())
-            test_email = f"testuser{timestamp}@test.com"
-            
-            payload = {
-                "email": test_email,
-                "password": "Test@123",
-                "full_name": "Test User"
-            }
-            
-            response, call = self.make_request(
-                "POST", 
-                f"{SERVICE_A_URL}/auth/signup",
-                json_data=payload,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 201:
-                data = response.json()
-                if "access_token" in data and "user" in data:
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-                    flow.root_cause = "Missing token or user in response"
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
+    async def _post(
+        self, path: str, payload: Dict, service: str, headers: Optional[Dict[str, str]] = None
+    ) -> APICall:
+        return await self.make_request("POST", path, headers=headers, json_data=payload, service=service)
     
-    def test_user_login(self, email: str, password: str, role: str = "customer") -> TestFlow:
-        """Test user login flow"""
-        flow = TestFlow(name=f"User Login ({role})", service="A")
-        
-        try:
-            payload = {"email": email, "password": password}
-            
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_A_URL}/auth/login",
-                json_data=payload,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                token = data.get("access_token")
-                user = data.get("user")
-                
-                if token and user:
-                    if role == "customer":
-                        self.customer_token = token
-                        self.customer_user_id = user.get("id")
-                    else:
-                        self.admin_token = token
-                        self.admin_user_id = user.get("id")
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.FAIL
-                    flow.root_cause = "Missing token or user in response"
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
+    def _auth_headers(self, auth: Optional[str]) -> Optional[Dict[str, str]]:
+        if auth == "customer":
+            return self._hdr_customer
+        if auth == "admin":
+            return self._hdr_admin
+        if auth == "invalid":
+            return INVALID_AUTH_HEADERS
+        return None
     
-    def test_get_current_user(self) -> TestFlow:
-        """Test GET /auth/me endpoint"""
-        flow = TestFlow(name="Get Current User", service="A")
-        
-        if not self.customer_token:
-            flow.result = TestResult.SKIPPED
-            flow.root_cause = "No auth token"
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_A_URL}/auth/me",
-                token=self.customer_token,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if "id" in data and "email" in data:
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-                    flow.root_cause = "Incomplete user data"
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
+    def store_login(self, role: str, data: Dict):
+        """Keep the token and user ID returned by a successful login"""
+        token = data["access_token"]
+        user_id = data["user"].get("id")
+        if role == "customer":
+            self.customer_token = token
+            self._hdr_customer = {"Authorization": f"Bearer {token}"}
+            self.customer_user_id = user_id
+        else:
+            self.admin_token = token
+            self._hdr_admin = {"Authorization": f"Bearer {token}"}
+            self.admin_user_id = user_id
     
-    def test_jwt_expiration_handling(self) -> TestFlow:
-        """Test JWT expiration handling"""
-        flow = TestFlow(name="JWT Expiration Handling", service="A")
-        
-        # Test with invalid token
-        invalid_token = "invalid.jwt.token"
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_A_URL}/auth/me",
-                token=invalid_token,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 401:
-                flow.result = TestResult.PASS
-            else:
-                flow.result = TestResult.WARNING
-                flow.root_cause = "Should return 401 for invalid token"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
+    async def _ensure(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Start factory() the first time key is requested and share its result"""
+        if key not in self._once:
+            self._once[key] = asyncio.create_task(factory())
+        return await self._once[key]
     
-    # ==================== PRODUCT CATALOG FLOWS ====================
+    def store_address(self, data: Dict):
+        """Keep the created address and the checkout body that ships to it"""
+        self.test_address_id = data.get("id")
+        self._checkout_payload = {
+            "shipping_address_id": self.test_address_id,
+            "billing_address_id": self.test_address_id
+        }
     
-    def test_get_categories(self) -> TestFlow:
-        """Test GET /catalog/categories"""
-        flow = TestFlow(name="Get Categories", service="B")
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/categories",
-                service="B"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                    if data:
-                        self.test_category_id = data[0].get("id")
-                else:
-                    flow.result = TestResult.WARNING
-                    flow.root_cause = "Expected array, got other type"
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
+    def cache_product(self, data: Dict):
+        """Keep a product detail response for flows that need its variants"""
+        self._product_cache[data["id"]] = data
     
-    def test_get_products(self) -> TestFlow:
-        """Test GET /catalog/products"""
-        flow = TestFlow(name="Get Products", service="B")
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/products",
-                service="B"
+    async def _get_product(self, product_id: int) -> Optional[Dict]:
+        """Return product detail from the cache, fetching it on first use"""
+        if product_id not in self._product_cache:
+            call = await self._ensure(
+                f"product:{product_id}",
+                lambda: self._get(f"/catalog/products/{product_id}", "B")
             )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                    if data:
-                        self.test_product_id = data[0].get("id")
-                else:
-                    flow.result = TestResult.WARNING
-                    flow.root_cause = "Expected array"
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
+            if call.response_code != 200:
+                return None
+            self._product_cache[product_id] = call.data
+        return self._product_cache[product_id]
     
-    def test_search_products(self) -> TestFlow:
-        """Test GET /catalog/search"""
-        flow = TestFlow(name="Search Products", service="B")
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/search?q=product",
-                service="B"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
+    async def run_flow(self, spec: FlowSpec) -> TestFlow:
+        """Run a flow once, after the flows it needs have finished"""
+        return await self._ensure(spec.name, lambda: self._run_spec(spec))
     
-    def test_get_product_detail(self) -> TestFlow:
-        """Test GET /catalog/products/{id}"""
-        flow = TestFlow(name="Get Product Detail", service="B")
+    async def _run_spec(self, spec: FlowSpec) -> TestFlow:
+        if spec.needs:
+            await asyncio.gather(*(self.run_flow(FLOWS_BY_NAME[name]) for name in spec.needs))
         
-        if not self.test_product_id:
-            flow.result = TestResult.SKIPPED
-            flow.root_cause = "No product ID available"
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/products/{self.test_product_id}",
-                service="B"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if "id" in data and "name" in data:
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
+        if spec.runner:
+            return await getattr(self, spec.runner)()
         
-        return flow
-    
-    # ==================== ADDRESS FLOWS ====================
-    
-    def test_create_address(self) -> TestFlow:
-        """Test POST /addresses"""
-        flow = TestFlow(name="Create Address", service="A")
+        flow = TestFlow(name=spec.name, service=spec.service)
         
-        if not self.customer_token:
+        if not all(getattr(self, attr) for attr in spec.requires):
             flow.result = TestResult.SKIPPED
+            flow.root_cause = spec.skip_reason
             return flow
         
-        try:
-            payload = {
-                "street": "123 Test St",
-                "city": "San Francisco",
-                "state": "CA",
-                "postal_code": "94102",
-                "country": "USA",
-                "address_type": "shipping",
-                "is_default": True
-            }
+        with flow_guard(flow):
+            path = spec.path(self) if callable(spec.path) else spec.path
+            payload = spec.payload(self) if callable(spec.payload) else spec.payload
             
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_A_URL}/addresses",
-                token=self.customer_token,
+            call = await self.make_request(
+                spec.method,
+                path,
+                headers=self._auth_headers(spec.auth),
                 json_data=payload,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 201:
-                data = response.json()
-                self.test_address_id = data.get("id")
-                flow.result = TestResult.PASS
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_get_addresses(self) -> TestFlow:
-        """Test GET /addresses"""
-        flow = TestFlow(name="Get Addresses", service="A")
-        
-        if not self.customer_token:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_A_URL}/addresses",
-                token=self.customer_token,
-                service="A"
+                service=spec.service
             )
             self.log_api_call(call, flow)
             
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
+            if call.response_code == spec.expect:
+                if spec.success(call):
                     flow.result = TestResult.PASS
+                    if spec.capture:
+                        spec.capture(self, call.data)
                 else:
-                    flow.result = TestResult.WARNING
+                    flow.result = spec.mismatch
+                    flow.root_cause = spec.mismatch_cause
+            elif spec.error_cause:
+                flow.result = spec.on_error
+                flow.root_cause = spec.error_cause
             else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
+                fail_flow(flow, call)
+                flow.result = spec.on_error
         
         return flow
     
-    # ==================== CART FLOWS ====================
+    # ==================== MULTI-STEP FLOWS ====================
     
-    def test_get_cart(self) -> TestFlow:
-        """Test GET /cart"""
-        flow = TestFlow(name="Get Cart", service="A")
-        
-        if not self.customer_token:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_A_URL}/cart",
-                token=self.customer_token,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if "items" in data:
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_add_to_cart(self) -> TestFlow:
+    async def test_add_to_cart(self) -> TestFlow:
         """Test POST /cart/items"""
         flow = TestFlow(name="Add to Cart", service="A")
         
@@ -553,20 +521,14 @@ class QAAutomationEngine:
             flow.root_cause = "Missing token or product ID"
             return flow
         
-        try:
-            # First, get product details to get variant info
-            product_response, _ = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/products/{self.test_product_id}",
-                service="B"
-            )
-            
-            if not product_response or product_response.status_code != 200:
+        with flow_guard(flow):
+            # Reuse the product fetched by Get Product Detail when possible
+            product_data = await self._get_product(self.test_product_id)
+            if not product_data:
                 flow.result = TestResult.SKIPPED
                 flow.root_cause = "Could not fetch product details"
                 return flow
             
-            product_data = product_response.json()
             variants = product_data.get("variants", [])
             
             if not variants:
@@ -585,18 +547,11 @@ class QAAutomationEngine:
                 "price": variant.get("price", product_data.get("base_price", 0))
             }
             
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_A_URL}/cart/items",
-                token=self.customer_token,
-                json_data=payload,
-                service="A"
-            )
+            call = await self._post("/cart/items", payload, "A", headers=self._hdr_customer)
             self.log_api_call(call, flow)
             
-            if response and response.status_code == 201:
-                data = response.json()
-                items = data.get("items", [])
+            if call.response_code == 201:
+                items = call.data.get("items", [])
                 if items:
                     self.test_cart_item_id = items[-1].get("id")
                     flow.result = TestResult.PASS
@@ -604,79 +559,11 @@ class QAAutomationEngine:
                     flow.result = TestResult.WARNING
                     flow.root_cause = "Cart item created but not in response"
             else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_update_cart_item(self) -> TestFlow:
-        """Test PUT /cart/items/{id}"""
-        flow = TestFlow(name="Update Cart Item", service="A")
-        
-        if not self.customer_token or not self.test_cart_item_id:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            payload = {"quantity": 2}
-            
-            response, call = self.make_request(
-                "PUT",
-                f"{SERVICE_A_URL}/cart/items/{self.test_cart_item_id}",
-                token=self.customer_token,
-                json_data=payload,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                flow.result = TestResult.PASS
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
+                fail_flow(flow, call)
         
         return flow
     
-    def test_remove_from_cart(self) -> TestFlow:
-        """Test DELETE /cart/items/{id}"""
-        flow = TestFlow(name="Remove from Cart", service="A")
-        
-        if not self.customer_token or not self.test_cart_item_id:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "DELETE",
-                f"{SERVICE_A_URL}/cart/items/{self.test_cart_item_id}",
-                token=self.customer_token,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                flow.result = TestResult.PASS
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    # ==================== CHECKOUT FLOWS ====================
-    
-    def test_create_payment_intent(self) -> TestFlow:
+    async def test_create_payment_intent(self) -> TestFlow:
         """Test POST /checkout/create-payment-intent"""
         flow = TestFlow(name="Create Payment Intent", service="A")
         
@@ -688,230 +575,31 @@ class QAAutomationEngine:
         # Ensure cart has items
         if not self.test_cart_item_id:
             # Try to add item first
-            add_flow = self.test_add_to_cart()
+            add_flow = await self._ensure("cart_item", self.test_add_to_cart)
             if add_flow.result != TestResult.PASS:
                 flow.result = TestResult.SKIPPED
                 flow.root_cause = "Could not add item to cart"
                 return flow
         
-        try:
-            payload = {
-                "shipping_address_id": self.test_address_id,
-                "billing_address_id": self.test_address_id
-            }
-            
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_A_URL}/checkout/create-payment-intent",
-                token=self.customer_token,
-                json_data=payload,
-                service="A"
+        with flow_guard(flow):
+            call = await self._post(
+                "/checkout/create-payment-intent", self._checkout_payload, "A", headers=self._hdr_customer
             )
             self.log_api_call(call, flow)
             
-            if response and response.status_code == 200:
-                data = response.json()
-                if "client_secret" in data and "order_id" in data:
-                    self.test_order_id = data.get("order_id")
+            if call.response_code == 200:
+                if "client_secret" in call.data and "order_id" in call.data:
+                    self.test_order_id = call.data.get("order_id")
                     flow.result = TestResult.PASS
                 else:
                     flow.result = TestResult.WARNING
                     flow.root_cause = "Missing client_secret or order_id"
             else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    # ==================== ORDER FLOWS ====================
-    
-    def test_get_orders(self) -> TestFlow:
-        """Test GET /orders"""
-        flow = TestFlow(name="Get Orders", service="A")
-        
-        if not self.customer_token:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_A_URL}/orders",
-                token=self.customer_token,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_get_order_detail(self) -> TestFlow:
-        """Test GET /orders/{id}"""
-        flow = TestFlow(name="Get Order Detail", service="A")
-        
-        if not self.customer_token or not self.test_order_id:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_A_URL}/orders/{self.test_order_id}",
-                token=self.customer_token,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if "id" in data and "order_number" in data:
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    # ==================== ADMIN FLOWS ====================
-    
-    def test_admin_create_category(self) -> TestFlow:
-        """Test POST /admin/categories"""
-        flow = TestFlow(name="Admin Create Category", service="B")
-        
-        if not self.admin_token:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            timestamp = int(time.time())
-            payload = {
-                "name": f"Test Category {timestamp}",
-                "slug": f"test-category-{timestamp}",
-                "description": "Test category for QA"
-            }
-            
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_B_URL}/catalog/admin/categories",
-                token=self.admin_token,
-                json_data=payload,
-                service="B"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 201:
-                data = response.json()
-                if "id" in data:
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_admin_update_order_status(self) -> TestFlow:
-        """Test POST /orders/{id}/status"""
-        flow = TestFlow(name="Admin Update Order Status", service="A")
-        
-        if not self.admin_token or not self.test_order_id:
-            flow.result = TestResult.SKIPPED
-            flow.root_cause = "Missing admin token or order ID"
-            return flow
-        
-        try:
-            payload = {"status": "packed"}
-            
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_A_URL}/orders/{self.test_order_id}/status",
-                token=self.admin_token,
-                json_data=payload,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if data.get("status") == "packed":
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-                    flow.root_cause = "Status not updated correctly"
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_admin_get_all_orders(self) -> TestFlow:
-        """Test GET /orders/admin/all"""
-        flow = TestFlow(name="Admin Get All Orders", service="A")
-        
-        if not self.admin_token:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_A_URL}/orders/admin/all",
-                token=self.admin_token,
-                service="A"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
+                fail_flow(flow, call)
         
         return flow
     
-    # ==================== INVENTORY FLOWS ====================
-    
-    def test_get_inventory(self) -> TestFlow:
+    async def test_get_inventory(self) -> TestFlow:
         """Test GET /inventory/{sku}"""
         flow = TestFlow(name="Get Inventory", service="B")
         
@@ -921,19 +609,13 @@ class QAAutomationEngine:
             flow.root_cause = "No product ID available"
             return flow
         
-        try:
+        with flow_guard(flow):
             # Get product to find SKU
-            product_response, _ = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/products/{self.test_product_id}",
-                service="B"
-            )
-            
-            if not product_response or product_response.status_code != 200:
+            product_data = await self._get_product(self.test_product_id)
+            if not product_data:
                 flow.result = TestResult.SKIPPED
                 return flow
             
-            product_data = product_response.json()
             variants = product_data.get("variants", [])
             
             if not variants:
@@ -943,30 +625,20 @@ class QAAutomationEngine:
             
             sku = variants[0].get("sku") or f"SKU-{self.test_product_id}"
             
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/inventory/{sku}",
-                service="B"
-            )
+            call = await self._get(f"/inventory/{sku}", "B")
             self.log_api_call(call, flow)
             
-            if response and response.status_code == 200:
-                data = response.json()
-                if "quantity" in data and "available" in data:
+            if call.response_code == 200:
+                if "quantity" in call.data and "available" in call.data:
                     flow.result = TestResult.PASS
                 else:
                     flow.result = TestResult.WARNING
             else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
+                fail_flow(flow, call)
         
         return flow
     
-    def test_reserve_inventory(self) -> TestFlow:
+    async def test_reserve_inventory(self) -> TestFlow:
         """Test POST /inventory/reserve (two-phase commit)"""
         flow = TestFlow(name="Reserve Inventory", service="B")
         
@@ -974,19 +646,13 @@ class QAAutomationEngine:
             flow.result = TestResult.SKIPPED
             return flow
         
-        try:
+        with flow_guard(flow):
             # Get product to find SKU
-            product_response, _ = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/products/{self.test_product_id}",
-                service="B"
-            )
-            
-            if not product_response or product_response.status_code != 200:
+            product_data = await self._get_product(self.test_product_id)
+            if not product_data:
                 flow.result = TestResult.SKIPPED
                 return flow
             
-            product_data = product_response.json()
             variants = product_data.get("variants", [])
             
             if not variants:
@@ -1001,160 +667,21 @@ class QAAutomationEngine:
                 "order_id": self.test_order_id or 999
             }
             
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_B_URL}/inventory/reserve",
-                json_data=payload,
-                service="B"
-            )
+            call = await self._post("/inventory/reserve", payload, "B")
             self.log_api_call(call, flow)
             
-            if response and response.status_code == 200:
-                data = response.json()
-                if data.get("success"):
+            if call.response_code == 200:
+                if call.data.get("success"):
                     flow.result = TestResult.PASS
                 else:
                     flow.result = TestResult.WARNING
-                    flow.root_cause = data.get("message", "Reservation failed")
+                    flow.root_cause = call.data.get("message", "Reservation failed")
             else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
+                fail_flow(flow, call)
         
         return flow
     
-    # ==================== NOTIFICATION FLOWS ====================
-    
-    def test_notification_service(self) -> TestFlow:
-        """Test POST /notify (Service C)"""
-        flow = TestFlow(name="Notification Service", service="C")
-        
-        try:
-            payload = {
-                "type": "ORDER_PLACED",
-                "data": {
-                    "order_id": 123,
-                    "order_number": "ORD-123",
-                    "user_email": "test@example.com"
-                }
-            }
-            
-            response, call = self.make_request(
-                "POST",
-                f"{SERVICE_C_URL}/notify",
-                json_data=payload,
-                service="C"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                flow.result = TestResult.PASS
-            else:
-                flow.result = TestResult.WARNING
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    # ==================== STORES & REVIEWS ====================
-    
-    def test_get_stores(self) -> TestFlow:
-        """Test GET /stores"""
-        flow = TestFlow(name="Get Stores", service="B")
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/stores",
-                service="B"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_get_nearby_stores(self) -> TestFlow:
-        """Test GET /stores/nearby"""
-        flow = TestFlow(name="Get Nearby Stores", service="B")
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/stores/nearby?lat=37.7749&lng=-122.4194&radius_km=10",
-                service="B"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    def test_get_product_reviews(self) -> TestFlow:
-        """Test GET /reviews/product/{id}"""
-        flow = TestFlow(name="Get Product Reviews", service="B")
-        
-        if not self.test_product_id:
-            flow.result = TestResult.SKIPPED
-            return flow
-        
-        try:
-            response, call = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/reviews/product/{self.test_product_id}",
-                service="B"
-            )
-            self.log_api_call(call, flow)
-            
-            if response and response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    flow.result = TestResult.PASS
-                else:
-                    flow.result = TestResult.WARNING
-            else:
-                flow.result = TestResult.FAIL
-                flow.root_cause = call.error or f"Status {call.response_code}"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
-        
-        return flow
-    
-    # ==================== CROSS-SERVICE VALIDATION ====================
-    
-    def test_cross_service_cart_order_flow(self) -> TestFlow:
+    async def test_cross_service_cart_order_flow(self) -> TestFlow:
         """Test complete flow: Product → Cart → Order"""
         flow = TestFlow(name="Cross-Service: Product → Cart → Order", service="A+B")
         
@@ -1162,21 +689,14 @@ class QAAutomationEngine:
             flow.result = TestResult.SKIPPED
             return flow
         
-        try:
+        with flow_guard(flow):
             # Step 1: Get product from Service B
-            product_response, call1 = self.make_request(
-                "GET",
-                f"{SERVICE_B_URL}/catalog/products/{self.test_product_id}",
-                service="B"
-            )
-            self.log_api_call(call1, flow)
-            
-            if not product_response or product_response.status_code != 200:
+            product_data = await self._get_product(self.test_product_id)
+            if not product_data:
                 flow.result = TestResult.FAIL
                 flow.root_cause = "Failed to get product"
                 return flow
             
-            product_data = product_response.json()
             variants = product_data.get("variants", [])
             
             if not variants:
@@ -1196,38 +716,23 @@ class QAAutomationEngine:
                 "price": variant.get("price", product_data.get("base_price", 0))
             }
             
-            cart_response, call2 = self.make_request(
-                "POST",
-                f"{SERVICE_A_URL}/cart/items",
-                token=self.customer_token,
-                json_data=cart_payload,
-                service="A"
-            )
+            call2 = await self._post("/cart/items", cart_payload, "A", headers=self._hdr_customer)
             self.log_api_call(call2, flow)
             
-            if not cart_response or cart_response.status_code != 201:
+            if call2.response_code != 201:
                 flow.result = TestResult.FAIL
                 flow.root_cause = "Failed to add to cart"
                 return flow
             
             # Step 3: Create order (Service A)
-            checkout_payload = {
-                "shipping_address_id": self.test_address_id,
-                "billing_address_id": self.test_address_id
-            }
-            
-            order_response, call3 = self.make_request(
-                "POST",
-                f"{SERVICE_A_URL}/checkout/create-payment-intent",
-                token=self.customer_token,
-                json_data=checkout_payload,
-                service="A"
+            call3 = await self._post(
+                "/checkout/create-payment-intent", self._checkout_payload, "A",
+                headers=self._hdr_customer
             )
             self.log_api_call(call3, flow)
             
-            if order_response and order_response.status_code == 200:
-                order_data = order_response.json()
-                if "order_id" in order_data:
+            if call3.response_code == 200:
+                if "order_id" in call3.data:
                     flow.result = TestResult.PASS
                 else:
                     flow.result = TestResult.WARNING
@@ -1235,185 +740,98 @@ class QAAutomationEngine:
             else:
                 flow.result = TestResult.FAIL
                 flow.root_cause = call3.error or "Failed to create order"
-                
-        except Exception as e:
-            flow.result = TestResult.FAIL
-            flow.root_cause = str(e)
         
         return flow
     
     # ==================== RUN ALL TESTS ====================
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Execute all QA validation tests"""
         print("🚀 Starting Comprehensive QA Validation Suite...")
         print("=" * 80)
         
-        # Authentication Flows
-        print("\n📋 Testing Authentication Flows...")
-        self.report.add_flow(self.test_user_registration())
-        self.report.add_flow(self.test_user_login(CUSTOMER_EMAIL, CUSTOMER_PASSWORD, "customer"))
-        self.report.add_flow(self.test_user_login(ADMIN_EMAIL, ADMIN_PASSWORD, "admin"))
-        self.report.add_flow(self.test_get_current_user())
-        self.report.add_flow(self.test_jwt_expiration_handling())
-        
-        # Product Catalog Flows
-        print("\n📋 Testing Product Catalog Flows...")
-        self.report.add_flow(self.test_get_categories())
-        self.report.add_flow(self.test_get_products())
-        self.report.add_flow(self.test_search_products())
-        self.report.add_flow(self.test_get_product_detail())
-        
-        # Address Flows
-        print("\n📋 Testing Address Management Flows...")
-        self.report.add_flow(self.test_create_address())
-        self.report.add_flow(self.test_get_addresses())
-        
-        # Cart Flows
-        print("\n📋 Testing Cart Flows...")
-        self.report.add_flow(self.test_get_cart())
-        self.report.add_flow(self.test_add_to_cart())
-        self.report.add_flow(self.test_update_cart_item())
-        self.report.add_flow(self.test_remove_from_cart())
-        
-        # Re-add item for checkout
-        self.test_add_to_cart()
+        # Every flow starts at once and waits only on the flows it needs
+        print(f"\n📋 Running {len(FLOWS)} flows across services {', '.join(SERVICE_URLS)}")
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.run_flow(spec)) for spec in FLOWS]
         
-        # Checkout Flows
-        print("\n📋 Testing Checkout Flows...")
-        self.report.add_flow(self.test_create_payment_intent())
-        
-        # Order Flows
-        print("\n📋 Testing Order Management Flows...")
-        self.report.add_flow(self.test_get_orders())
-        self.report.add_flow(self.test_get_order_detail())
-        
-        # Admin Flows
-        print("\n📋 Testing Admin Flows...")
-        self.report.add_flow(self.test_admin_create_category())
-        self.report.add_flow(self.test_admin_update_order_status())
-        self.report.add_flow(self.test_admin_get_all_orders())
-        
-        # Inventory Flows
-        print("\n📋 Testing Inventory Flows...")
-        self.report.add_flow(self.test_get_inventory())
-        self.report.add_flow(self.test_reserve_inventory())
-        
-        # Notification Flows
-        print("\n📋 Testing Notification Flows...")
-        self.report.add_flow(self.test_notification_service())
-        
-        # Stores & Reviews
-        print("\n📋 Testing Stores & Reviews Flows...")
-        self.report.add_flow(self.test_get_stores())
-        self.report.add_flow(self.test_get_nearby_stores())
-        self.report.add_flow(self.test_get_product_reviews())
-        
-        # Cross-Service Flows
-        print("\n📋 Testing Cross-Service Flows...")
-        self.report.add_flow(self.test_cross_service_cart_order_flow())
+        for spec, task in zip(FLOWS, tasks):
+            if spec.report:
+                self.report.add_flow(task.result())
         
+        self.report.end_ns = time.perf_counter_ns()
         self.report.end_time = datetime.now()
         
-        # Document fixes applied
-        self.report.fixes_applied = [
-            {
-                "file": "frontend/src/context/AuthContext.tsx",
-                "lines": "25-26, 60-64, 47-51",
-                "description": "Fixed API endpoint URLs and token field handling",
-                "before": "VITE_USER_SERVICE_URL → http://localhost:4001, /auth/register, token field",
-                "after": "VITE_SERVICE_A_URL → http://localhost:8001, /auth/signup, access_token field",
-                "status": "✅ Fixed"
-            },
-            {
-                "file": "frontend/src/pages/Products.tsx",
-                "lines": "16-17, 26-27",
-                "description": "Fixed product service URL and endpoint path",
-                "before": "VITE_PRODUCT_SERVICE_URL → http://localhost:4002, /products, response.data.products",
-                "after": "VITE_SERVICE_B_URL → http://localhost:8002, /catalog/products, response.data",
-                "status": "✅ Fixed"
-            }
-        ]
-        
-        self.report.observations = [
-            "Service B admin endpoints (catalog) do not require authentication - this may be intentional for MVP",
-            "Service A admin endpoints properly require admin role validation",
-            "Token response uses 'access_token' field in backend, handled flexibly in frontend",
-            "Cart price fetching from Service B is noted as TODO in Service A cart.py (line 57-58)",
-            "Stripe integration requires valid API keys in environment variables",
-            "Notification service (Service C) properly handles events asynchronously",
-            "Cross-service inventory reservation (two-phase commit) properly implemented"
-        ]
+        # Static findings - shared read-only constants, rendered at import
+        self.report.fixes_applied = _FIXES_APPLIED
+        self.report.observations = _OBSERVATIONS
         
         print("\n✅ QA Validation Suite Complete!")
         print("=" * 80)
     
     def generate_report(self):
         """Generate comprehensive QA report"""
-        duration = (self.report.end_time - self.report.start_time).total_seconds()
+        duration = (self.report.end_ns - self.report.start_ns) / 1e9
         summary = self.report.get_summary()
-        
-        print("\n" + "=" * 80)
-        print("📊 COMPREHENSIVE QA VALIDATION REPORT")
-        print("=" * 80)
-        print(f"\n⏱️  Duration: {duration:.2f} seconds")
-        print(f"\n📈 Summary:")
-        print(f"   Total Flows Tested: {summary['total']}")
-        print(f"   ✅ Passed: {summary['passed']}")
-        print(f"   ❌ Failed: {summary['failed']}")
-        print(f"   ⚠️  Warnings: {summary['warnings']}")
-        print(f"   ⏭️  Skipped: {summary['skipped']}")
-        print(f"   Success Rate: {summary['success_rate']}")
-        
-        print("\n" + "=" * 80)
-        print("📋 FLOW VALIDATION SUMMARY")
-        print("=" * 80)
-        print(f"\n{'Flow':<50} {'Result':<10} {'Service':<15} {'APIs':<5} {'Root Cause'}")
-        print("-" * 80)
+        # Collect every line and write the report with a single syscall
+        out: List[str] = []
+        line = out.append
+        
+        line("\n" + "=" * 80)
+        line("📊 COMPREHENSIVE QA VALIDATION REPORT")
+        line("=" * 80)
+        line(f"\n⏱️  Duration: {duration:.2f} seconds")
+        line(f"\n📈 Summary:")
+        line(f"   Total Flows Tested: {summary['total']}")
+        line(f"   ✅ Passed: {summary['passed']}")
+        line(f"   ❌ Failed: {summary['failed']}")
+        line(f"   ⚠️  Warnings: {summary['warnings']}")
+        line(f"   ⏭️  Skipped: {summary['skipped']}")
+        line(f"   Success Rate: {summary['success_rate']}")
+        
+        line("\n" + "=" * 80)
+        line("📋 FLOW VALIDATION SUMMARY")
+        line("=" * 80)
+        line(f"\n{'Flow':<50} {'Result':<10} {'Service':<15} {'APIs':<5} {'Root Cause'}")
+        line("-" * 80)
         
         for flow in self.report.flows:
-            result_icon = flow.result.value
-            api_count = len(flow.apis)
             root_cause = flow.root_cause[:40] if flow.root_cause else "-"
-            print(f"{flow.name:<50} {result_icon:<10} {flow.service:<15} {api_count:<5} {root_cause}")
+            line(f"{flow.name:<50} {RESULT_SYMBOL[flow.result]:<10} {flow.service:<15} {len(flow.apis):<5} {root_cause}")
         
-        print("\n" + "=" * 80)
-        print("🔍 API HEALTH OVERVIEW")
-        print("=" * 80)
+        line("\n" + "=" * 80)
+        line("🔍 API HEALTH OVERVIEW")
+        line("=" * 80)
         
         for service, health in self.report.api_health.items():
             total = health["total"]
             success = health["success"]
             failures = health["failures"]
-            avg_latency = health["avg_latency"]
-            
-            print(f"\n{service}:")
-            print(f"   Total Requests: {total}")
-            print(f"   ✅ Success: {success} ({(success/total*100):.1f}%)" if total > 0 else "   ✅ Success: 0")
-            print(f"   ❌ Failures: {failures}")
-            print(f"   ⏱️  Avg Latency: {avg_latency*1000:.2f}ms" if avg_latency > 0 else "   ⏱️  Avg Latency: N/A")
-        
-        if self.report.fixes_applied:
-            print("\n" + "=" * 80)
-            print("🔧 FIXES APPLIED")
-            print("=" * 80)
-            for fix in self.report.fixes_applied:
-                print(f"\n{fix['file']}:{fix['lines']}")
-                print(f"   {fix['description']}")
-                print(f"   {fix['before']} → {fix['after']}")
-                print(f"   Status: {fix['status']}")
-        
-        if self.report.observations:
-            print("\n" + "=" * 80)
-            print("💡 OBSERVATIONS & RECOMMENDATIONS")
-            print("=" * 80)
-            for obs in self.report.observations:
-                print(f"   • {obs}")
-        
-        print("\n" + "=" * 80)
-        print("✅ WHAT WAS VERIFIED")
-        print("=" * 80)
-        print("""
+            timed = health["timed"]
+            avg_latency_ms = health["sum_latency_ns"] / timed / 1e6 if timed else 0.0
+            p50 = latency_percentile(health["hist"], 0.50)
+            p95 = latency_percentile(health["hist"], 0.95)
+            
+            line(f"\n{service}:")
+            line(f"   Total Requests: {total}")
+            line(f"   ✅ Success: {success} ({(success/total*100):.1f}%)" if total > 0 else "   ✅ Success: 0")
+            line(f"   ❌ Failures: {failures}")
+            line(f"   ⏱️  Avg Latency: {avg_latency_ms:.2f}ms" if avg_latency_ms > 0 else "   ⏱️  Avg Latency: N/A")
+            if p50 is not None:
+                line(f"   ⏱️  p50/p95 Latency: <{p50*1000:.2f}ms / <{p95*1000:.2f}ms")
+        
+        fixes = self.report.fixes_applied
+        if fixes:
+            line(_FIXES_APPLIED_RENDERED if fixes is _FIXES_APPLIED else render_fixes(fixes))
+        
+        observations = self.report.observations
+        if observations:
+            line(_OBSERVATIONS_RENDERED if observations is _OBSERVATIONS else render_observations(observations))
+        
+        line("\n" + "=" * 80)
+        line("✅ WHAT WAS VERIFIED")
+        line("=" * 80)
+        line("""
 The QA automation validated all possible functional paths within the platform:
    ✓ User flows: Registration, login, logout, profile, addresses
    ✓ Product flows: Browse, search, categories, variants, details
@@ -1434,26 +852,262 @@ Practical limitations:
    • Map-based store selection tested via API (Leaflet UI not automated)
         """)
         
-        print("\n" + "=" * 80)
-        print("📝 VALIDATION CONFIRMATION")
-        print("=" * 80)
-        print("✓ No unnecessary files created")
-        print("✓ No commits or pushes made")
-        print("✓ All actions local and ephemeral")
-        print("✓ Minimal fixes applied only when required")
-        print("\n✅ QA Validation Complete - All possible paths verified!")
-        print("=" * 80)
+        line("\n" + "=" * 80)
+        line("📝 VALIDATION CONFIRMATION")
+        line("=" * 80)
+        line("✓ No unnecessary files created")
+        line("✓ No commits or pushes made")
+        line("✓ All actions local and ephemeral")
+        line("✓ Minimal fixes applied only when required")
+        line("\n✅ QA Validation Complete - All possible paths verified!")
+        line("=" * 80)
+        
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+    
+    async def aclose(self):
+        """Close the per-service HTTP clients"""
+        await asyncio.gather(*(client.aclose() for client in self.clients.values()))
+
+
+def is_list(call: APICall) -> bool:
+    """Validator for endpoints that return a JSON array - checked without parsing"""
+    return call.content[:1] == b"["
+
+
+def has_keys(*keys: str) -> Callable[[APICall], bool]:
+    """Build a validator that passes when a dict response has all the keys"""
+    required = frozenset(keys)
+    
+    def validate(call: APICall) -> bool:
+        data = call.data
+        return isinstance(data, dict) and data.keys() >= required
+    return validate
+
+
+def capture_first_id(attr: str) -> Callable[[QAAutomationEngine, Any], None]:
+    """Store data[0]["id"] of a non-empty list response on the engine"""
+    def capture(engine: QAAutomationEngine, data: Any):
+        if data:
+            setattr(engine, attr, data[0].get("id"))
+    return capture
+
+
+def registration_payload(engine: QAAutomationEngine) -> Dict:
+    # Generate unique email
+    return {
+        "email": f"testuser{int(time.time())}@test.com",
+        "password": "Test@123",
+        "full_name": "Test User"
+    }
+
+
+def category_payload(engine: QAAutomationEngine) -> Dict:
+    timestamp = int(time.time())
+    return {
+        "name": f"Test Category {timestamp}",
+        "slug": f"test-category-{timestamp}",
+        "description": "Test category for QA"
+    }
+
+
+CUSTOMER_LOGIN = "User Login (customer)"
+ADMIN_LOGIN = "User Login (admin)"
+
+# Static request bodies and paths - built once and shared by every run
+CUSTOMER_CREDENTIALS = {"email": CUSTOMER_EMAIL, "password": CUSTOMER_PASSWORD}
+ADMIN_CREDENTIALS = {"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+TEST_ADDRESS = {
+    "street": "123 Test St",
+    "city": "San Francisco",
+    "state": "CA",
+    "postal_code": "94102",
+    "country": "USA",
+    "address_type": "shipping",
+    "is_default": True
+}
+NOTIFY_PAYLOAD = {
+    "type": "ORDER_PLACED",
+    "data": {
+        "order_id": 123,
+        "order_number": "ORD-123",
+        "user_email": "test@example.com"
+    }
+}
+NEARBY_STORES_PATH = "/stores/nearby?lat=37.7749&lng=-122.4194&radius_km=10"
+
+# Report order follows declaration order; `needs` decides what waits on what
+FLOWS: Tuple[FlowSpec, ...] = (
+    # Authentication
+    FlowSpec(
+        "User Registration", "A", "POST", "/auth/signup",
+        payload=registration_payload, expect=201,
+        success=has_keys("access_token", "user"),
+        mismatch_cause="Missing token or user in response"
+    ),
+    FlowSpec(
+        CUSTOMER_LOGIN, "A", "POST", "/auth/login",
+        payload=CUSTOMER_CREDENTIALS,
+        success=lambda c: bool(c.data.get("access_token") and c.data.get("user")),
+        capture=lambda e, d: e.store_login("customer", d),
+        mismatch=TestResult.FAIL, mismatch_cause="Missing token or user in response"
+    ),
+    FlowSpec(
+        ADMIN_LOGIN, "A", "POST", "/auth/login",
+        payload=ADMIN_CREDENTIALS,
+        success=lambda c: bool(c.data.get("access_token") and c.data.get("user")),
+        capture=lambda e, d: e.store_login("admin", d),
+        mismatch=TestResult.FAIL, mismatch_cause="Missing token or user in response"
+    ),
+    FlowSpec(
+        "Get Current User", "A", "GET", "/auth/me", auth="customer",
+        requires=("customer_token",), skip_reason="No auth token", needs=(CUSTOMER_LOGIN,),
+        success=has_keys("id", "email"),
+        mismatch_cause="Incomplete user data"
+    ),
+    FlowSpec(
+        "JWT Expiration Handling", "A", "GET", "/auth/me", auth="invalid", expect=401,
+        on_error=TestResult.WARNING, error_cause="Should return 401 for invalid token"
+    ),
+    # Product catalog
+    FlowSpec(
+        "Get Categories", "B", "GET", "/catalog/categories",
+        success=is_list,
+        capture=capture_first_id("test_category_id"),
+        mismatch_cause="Expected array, got other type"
+    ),
+    FlowSpec(
+        # Only the first product is used - don't have the service page in 50
+        "Get Products", "B", "GET", "/catalog/products?limit=1",
+        success=is_list,
+        capture=capture_first_id("test_product_id"),
+        mismatch_cause="Expected array"
+    ),
+    FlowSpec(
+        "Search Products", "B", "GET", "/catalog/search?q=product&limit=1",
+        success=is_list
+    ),
+    FlowSpec(
+        "Get Product Detail", "B", "GET", lambda e: f"/catalog/products/{e.test_product_id}",
+        requires=("test_product_id",), skip_reason="No product ID available", needs=("Get Products",),
+        success=has_keys("id", "name"),
+        capture=lambda e, d: e.cache_product(d)
+    ),
+    # Addresses
+    FlowSpec(
+        "Create Address", "A", "POST", "/addresses", auth="customer", expect=201,
+        payload=TEST_ADDRESS,
+        requires=("customer_token",), needs=(CUSTOMER_LOGIN,),
+        capture=lambda e, d: e.store_address(d)
+    ),
+    FlowSpec(
+        "Get Addresses", "A", "GET", "/addresses", auth="customer",
+        requires=("customer_token",), needs=("Create Address",),
+        success=is_list
+    ),
+    # Cart
+    FlowSpec(
+        "Get Cart", "A", "GET", "/cart", auth="customer",
+        requires=("customer_token",), needs=(CUSTOMER_LOGIN,),
+        success=has_keys("items")
+    ),
+    FlowSpec("Add to Cart", "A", runner="test_add_to_cart", needs=(CUSTOMER_LOGIN, "Get Product Detail")),
+    FlowSpec(
+        "Update Cart Item", "A", "PUT", lambda e: f"/cart/items/{e.test_cart_item_id}",
+        payload={"quantity": 2}, auth="customer",
+        requires=("customer_token", "test_cart_item_id"), needs=("Add to Cart",)
+    ),
+    FlowSpec(
+        "Remove from Cart", "A", "DELETE", lambda e: f"/cart/items/{e.test_cart_item_id}", auth="customer",
+        requires=("customer_token", "test_cart_item_id"), needs=("Update Cart Item",)
+    ),
+    # Re-add item for checkout
+    FlowSpec("Re-add to Cart", "A", runner="test_add_to_cart", needs=("Remove from Cart",), report=False),
+    # Checkout
+    FlowSpec(
+        "Create Payment Intent", "A", runner="test_create_payment_intent",
+        needs=("Create Address", "Re-add to Cart")
+    ),
+    # Orders
+    FlowSpec(
+        "Get Orders", "A", "GET", "/orders", auth="customer",
+        requires=("customer_token",), needs=(CUSTOMER_LOGIN,),
+        success=is_list
+    ),
+    FlowSpec(
+        "Get Order Detail", "A", "GET", lambda e: f"/orders/{e.test_order_id}", auth="customer",
+        requires=("customer_token", "test_order_id"), needs=("Create Payment Intent",),
+        success=has_keys("id", "order_number")
+    ),
+    # Admin
+    FlowSpec(
+        "Admin Create Category", "B", "POST", "/catalog/admin/categories",
+        payload=category_payload, auth="admin", expect=201,
+        requires=("admin_token",), needs=(ADMIN_LOGIN,),
+        success=has_keys("id")
+    ),
+    FlowSpec(
+        "Admin Update Order Status", "A", "POST", lambda e: f"/orders/{e.test_order_id}/status",
+        payload={"status": "packed"}, auth="admin",
+        requires=("admin_token", "test_order_id"), skip_reason="Missing admin token or order ID",
+        needs=(ADMIN_LOGIN, "Create Payment Intent"),
+        success=lambda c: c.data.get("status") == "packed",
+        mismatch_cause="Status not updated correctly"
+    ),
+    FlowSpec(
+        "Admin Get All Orders", "A", "GET", "/orders/admin/all", auth="admin",
+        requires=("admin_token",), needs=(ADMIN_LOGIN,),
+        success=is_list
+    ),
+    # Inventory
+    # Waits on the detail flow so the product it cached is reused, not fetched again
+    FlowSpec("Get Inventory", "B", runner="test_get_inventory", needs=("Get Product Detail",)),
+    FlowSpec("Reserve Inventory", "B", runner="test_reserve_inventory", needs=("Create Payment Intent",)),
+    # Notifications
+    FlowSpec(
+        "Notification Service", "C", "POST", "/notify",
+        payload=NOTIFY_PAYLOAD,
+        on_error=TestResult.WARNING
+    ),
+    # Stores & reviews
+    FlowSpec(
+        "Get Stores", "B", "GET", "/stores",
+        success=is_list
+    ),
+    FlowSpec(
+        "Get Nearby Stores", "B", "GET", NEARBY_STORES_PATH,
+        success=is_list
+    ),
+    FlowSpec(
+        "Get Product Reviews", "B", "GET", lambda e: f"/reviews/product/{e.test_product_id}",
+        requires=("test_product_id",), needs=("Get Products",),
+        success=is_list
+    ),
+    # Cross-service
+    FlowSpec(
+        "Cross-Service: Product → Cart → Order", "A+B", runner="test_cross_service_cart_order_flow",
+        needs=("Create Payment Intent",)
+    ),
+)
+FLOWS_BY_NAME: Dict[str, FlowSpec] = {spec.name: spec for spec in FLOWS}
+
+
+async def main():
+    async with QAAutomationEngine() as engine:
+        await engine.run_all_tests()
+        engine.generate_report()
 
 
 if __name__ == "__main__":
+    if UVLOOP_ENABLED:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
-        engine = QAAutomationEngine()
-        engine.run_all_tests()
-        engine.generate_report()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n⚠️  QA Validation interrupted by user")
     except Exception as e:
         print(f"\n\n❌ QA Validation failed with error: {e}")
         import traceback
         traceback.print_exc()
-
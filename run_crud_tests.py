@@ -0,0 +1,54 @@
+"""Run the CRUD test scripts of both services concurrently"""
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SERVICES_DIR = Path(__file__).resolve().parent / "services"
+SERVICES = ("service-a-identity-commerce", "service-b-catalog-fulfillment")
+
+def _python(service_dir: Path) -> str:
+    """Interpreter from the service's own virtualenv, falling back to this one"""
+    for candidate in (".venv/bin/python", ".venv/Scripts/python.exe"):
+        path = service_dir / candidate
+        if path.exists():
+            return str(path)
+    return sys.executable
+
+def run(service: str) -> subprocess.CompletedProcess:
+    """Run one service's test_crud.py from its own directory and capture the output"""
+    # Each service imports its own top-level `app` package, so they cannot share
+    # a process - a subprocess per service keeps them isolated on separate DBs
+    service_dir = SERVICES_DIR / service
+    return subprocess.run(
+        [_python(service_dir), "test_crud.py"],
+        cwd=service_dir,
+        # A piped child would otherwise encode stdout with the ANSI code page on
+        # Windows and fail on the first ✓ it prints
+        env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+
+def main():
+    """Run every service's CRUD test in parallel and report them in order"""
+    # The services hit different databases, so wall time is max(A, B) rather than A + B
+    with ThreadPoolExecutor(max_workers=len(SERVICES)) as ex:
+        results = list(ex.map(run, SERVICES))
+    
+    failed = []
+    for service, result in zip(SERVICES, results):
+        sys.stdout.write(f"\n### {service}\n{result.stdout}{result.stderr}")
+        if result.returncode != 0:
+            failed.append(service)
+    
+    if failed:
+        print(f"\n✗ CRUD tests failed for: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\n✓ CRUD tests passed for all {len(SERVICES)} services")
+
+if __name__ == "__main__":
+    main()
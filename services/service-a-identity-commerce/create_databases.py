@@ -1,59 +1,69 @@
 """Script to create databases on RDS if they don't exist"""
+import re
 import sys
 from sqlalchemy import create_engine, text
-from app.core.config import settings
+from app.core.config import get_settings
 
-def create_database(db_name: str):
-    """Create a database if it doesn't exist"""
-    # Connect to default postgres database to create new databases
-    default_url = settings.DATABASE_URL.replace(f"/{settings.DB_NAME}", "/postgres")
-    
+# Built once and reused for every database checked
+_CHECK = text("SELECT 1 FROM pg_database WHERE datname = :db_name")
+# CREATE DATABASE can't take a bound parameter, so only plain identifiers are allowed
+_DB_NAME_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+
+def _ensure_db(connection, db_name: str) -> bool:
+    """Create a database over an open AUTOCOMMIT connection if it doesn't exist"""
     print(f"\nCreating database: {db_name}")
-    print(f"Connecting to: {default_url.split('@')[1] if '@' in default_url else 'RDS'}...")
+    
+    if not _DB_NAME_RE.fullmatch(db_name):
+        print(f"   [ERROR] Invalid database name: {db_name!r}")
+        return False
     
     try:
-        engine = create_engine(default_url, pool_pre_ping=True, isolation_level="AUTOCOMMIT")
+        # Check if database exists
+        result = connection.execute(_CHECK, {"db_name": db_name})
         
-        with engine.connect() as connection:
-            # Check if database exists
-            result = connection.execute(
-                text("SELECT 1 FROM pg_database WHERE datname = :db_name"),
-                {"db_name": db_name}
-            )
-            exists = result.fetchone()
-            
-            if exists:
-                print(f"   [OK] Database '{db_name}' already exists")
-                return True
-            
-            # Create database
-            connection.execute(text(f'CREATE DATABASE "{db_name}"'))
-            print(f"   [OK] Database '{db_name}' created successfully!")
-            
-            # Verify creation
-            result = connection.execute(
-                text("SELECT 1 FROM pg_database WHERE datname = :db_name"),
-                {"db_name": db_name}
-            )
-            if result.fetchone():
-                print(f"   [OK] Verified: Database '{db_name}' exists")
-                return True
-            else:
-                print(f"   [ERROR] Database creation verification failed")
-                return False
-                
+        if result.fetchone():
+            print(f"   [OK] Database '{db_name}' already exists")
+            return True
+        
+        # Create database - CREATE DATABASE raises if it did not succeed
+        connection.execute(text(f'CREATE DATABASE "{db_name}"'))
+        print(f"   [OK] Database '{db_name}' created successfully!")
+        return True
+    
     except Exception as e:
         print(f"   [ERROR] Error creating database: {str(e)}")
         return False
+
+def create_databases(db_names: list[str], default_url: str) -> bool:
+    """Create every missing database over a single connection"""
+    print(f"\nConnecting to: {default_url.split('@')[1] if '@' in default_url else 'RDS'}...")
+    
+    engine = create_engine(default_url, pool_pre_ping=True, isolation_level="AUTOCOMMIT")
+    try:
+        with engine.connect() as connection:
+            # Evaluate every database even if an earlier one fails
+            results = [_ensure_db(connection, db_name) for db_name in db_names]
+        return all(results)
+    except Exception as e:
+        print(f"   [ERROR] Could not connect: {str(e)}")
+        return False
     finally:
         engine.dispose()
 
 def main():
     """Create required databases"""
+    # Read settings once; every database is created through the same URL
+    settings = get_settings()
+    db_url = settings.DATABASE_URL
+    db_name_default = settings.DB_NAME
+    db_host = settings.DB_HOST
+    # Connect to default postgres database to create new databases
+    default_url = db_url.replace(f"/{db_name_default}", "/postgres")
+    
     print("=" * 60)
     print("Database Creation Script")
     print("=" * 60)
-    print(f"\nRDS Endpoint: {settings.DB_HOST}")
+    print(f"\nRDS Endpoint: {db_host}")
     print(f"Default database: postgres")
     
     databases = [
@@ -61,10 +71,7 @@ def main():
         "ecom_catalog_fulfillment"
     ]
     
-    success = True
-    for db_name in databases:
-        if not create_database(db_name):
-            success = False
+    success = create_databases(databases, default_url)
     
     print("\n" + "=" * 60)
     if success:
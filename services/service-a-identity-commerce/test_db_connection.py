@@ -1,13 +1,34 @@
 """Test script to verify database configuration and connection"""
 import sys
+from functools import lru_cache
 from sqlalchemy import create_engine, text
 from app.core.config import settings
 
+SEP = "=" * 60
+BANNER = "\n" + SEP
+
+# Everything the checks report, fetched in a single round trip
+_PROBE = text("""
+    SELECT version(),
+           current_database(),
+           ARRAY(
+               SELECT table_name::text
+               FROM information_schema.tables
+               WHERE table_schema = 'public'
+               ORDER BY table_name
+           );
+""")
+
+@lru_cache(maxsize=1)
+def _engine():
+    """Single-connection engine shared by every check in this script"""
+    return create_engine(settings.DATABASE_URL, pool_pre_ping=True, pool_size=1, max_overflow=0)
+
 def test_configuration():
     """Test that configuration is loaded correctly"""
-    print("=" * 60)
+    print(SEP)
     print("Testing Database Configuration - Service A")
-    print("=" * 60)
+    print(SEP)
     
     print(f"\n1. Configuration loaded:")
     print(f"   DB_HOST: {settings.DB_HOST}")
@@ -21,64 +42,31 @@ def test_configuration():
     
     return True
 
-def test_connection():
+def test_connection(probe):
     """Test database connection"""
-    print("\n3. Testing database connection...")
-    try:
-        engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT version();"))
-            version = result.fetchone()[0]
-            print(f"   [OK] Connection successful!")
-            print(f"   PostgreSQL version: {version.split(',')[0]}")
-            
-            # Check if database exists and is accessible
-            result = connection.execute(text("SELECT current_database();"))
-            db_name = result.fetchone()[0]
-            print(f"   Current database: {db_name}")
-            
-            return True
-    except Exception as e:
-        print(f"   [ERROR] Connection failed: {str(e)}")
-        return False
+    version, db_name, _ = probe
+    print(f"   [OK] Connection successful!")
+    print(f"   PostgreSQL version: {version.split(',')[0]}")
+    print(f"   Current database: {db_name}")
+    return True
 
-def test_database_exists():
+def test_database_exists(probe):
     """Check if the database exists"""
     print("\n4. Checking database...")
-    try:
-        engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT current_database();"))
-            db_name = result.fetchone()[0]
-            print(f"   [OK] Database '{db_name}' is accessible")
-            return True
-    except Exception as e:
-        print(f"   [ERROR] Database check failed: {str(e)}")
-        return False
+    print(f"   [OK] Database '{probe[1]}' is accessible")
+    return True
 
-def check_tables():
+def check_tables(probe):
     """Check existing tables"""
     print("\n5. Checking existing tables...")
-    try:
-        engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-        with engine.connect() as connection:
-            result = connection.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public'
-                ORDER BY table_name;
-            """))
-            tables = [row[0] for row in result]
-            if tables:
-                print(f"   Found {len(tables)} table(s):")
-                for table in tables:
-                    print(f"     - {table}")
-            else:
-                print("   No tables found yet. Run migrations to create tables.")
-            return True
-    except Exception as e:
-        print(f"   [ERROR] Failed to check tables: {str(e)}")
-        return False
+    tables = probe[2]
+    if tables:
+        print(f"   Found {len(tables)} table(s):")
+        for table in tables:
+            print(f"     - {table}")
+    else:
+        print("   No tables found yet. Run migrations to create tables.")
+    return True
 
 if __name__ == "__main__":
     print("\n")
@@ -86,11 +74,21 @@ if __name__ == "__main__":
     
     try:
         success &= test_configuration()
-        success &= test_connection()
-        success &= test_database_exists()
-        success &= check_tables()
         
-        print("\n" + "=" * 60)
+        # One query on one connection serves every database check
+        print("\n3. Testing database connection...")
+        try:
+            with _engine().connect() as connection:
+                probe = connection.execute(_PROBE).one()
+        except Exception as e:
+            print(f"   [ERROR] Connection failed: {str(e)}")
+            success = False
+        else:
+            success &= test_connection(probe)
+            success &= test_database_exists(probe)
+            success &= check_tables(probe)
+        
+        print(BANNER)
         if success:
             print("[SUCCESS] All checks passed! Configuration is correct.")
             print("\nNext steps:")
@@ -99,7 +97,7 @@ if __name__ == "__main__":
         else:
             print("[FAILED] Some checks failed. Please review the errors above.")
             sys.exit(1)
-        print("=" * 60 + "\n")
+        print(SEP, end="\n\n")
     except Exception as e:
         print(f"\n[ERROR] Error: {str(e)}")
         import traceback
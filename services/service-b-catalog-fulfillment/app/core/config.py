@@ -1,4 +1,5 @@
 """Configuration settings for Service B - Catalog & Fulfillment"""
+from functools import lru_cache
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from urllib.parse import quote_plus
@@ -19,14 +20,16 @@ class Settings(BaseSettings):
     @classmethod
     def build_database_url(cls, data):
         """Construct DATABASE_URL from individual parameters if not provided"""
-        if isinstance(data, dict):
-            database_url = data.get('DATABASE_URL', '').strip()
-            if not database_url:
-                if all([data.get('DB_HOST'), data.get('DB_USER'), data.get('DB_PASSWORD')]):
-                    password = quote_plus(str(data['DB_PASSWORD']))
-                    db_name = data.get('DB_NAME', 'ecom_catalog_fulfillment')
-                    db_port = data.get('DB_PORT', 5432)
-                    data['DATABASE_URL'] = f"postgresql+psycopg://{data['DB_USER']}:{password}@{data['DB_HOST']}:{db_port}/{db_name}"
+        if not isinstance(data, dict):
+            return data
+        # Common case: a full URL was supplied, nothing to build
+        if data.get('DATABASE_URL', '').strip():
+            return data
+        if data.get('DB_HOST') and data.get('DB_USER') and data.get('DB_PASSWORD'):
+            password = quote_plus(str(data['DB_PASSWORD']))
+            db_name = data.get('DB_NAME', 'ecom_catalog_fulfillment')
+            db_port = data.get('DB_PORT', 5432)
+            data['DATABASE_URL'] = f"postgresql+psycopg://{data['DB_USER']}:{password}@{data['DB_HOST']}:{db_port}/{db_name}"
         return data
     
     # Search
@@ -39,7 +42,13 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:5173"]
     
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, validated once on first use"""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,27 +1,40 @@
 """CRUD Test Example - Category Model"""
 import sys
+from functools import lru_cache
+from sqlalchemy import delete, func, insert, inspect, or_, select, text, update
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.models.category import Category
 from app.core.config import settings
 
-def test_create():
+SEP = "=" * 60
+BANNER = "\n" + SEP
+
+# Row count as estimated by the planner; -1 until the table is first analyzed
+_ROW_ESTIMATE = text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table")
+
+@lru_cache(maxsize=1)
+def _table_set(bind) -> frozenset:
+    """Table names in the database, reflected once per engine"""
+    return frozenset(inspect(bind).get_table_names())
+
+def test_create(db: Session):
     """Test CREATE operation"""
-    print("\n" + "=" * 60)
+    print(BANNER)
     print("1. CREATE - Creating a new category...")
-    print("=" * 60)
+    print(SEP)
     
-    db: Session = SessionLocal()
     try:
-        # Create a test category
-        test_category = Category(
-            name="Test Category",
-            slug="test-category",
-            description="This is a test category for CRUD operations"
-        )
-        db.add(test_category)
-        db.commit()
-        db.refresh(test_category)
+        # Create a test category; RETURNING hands back the generated columns
+        test_category = db.execute(
+            insert(Category)
+            .values(
+                name="Test Category",
+                slug="test-category",
+                description="This is a test category for CRUD operations"
+            )
+            .returning(Category.id, Category.name, Category.slug, Category.description, Category.created_at)
+        ).one()
         
         print(f"   ✓ Category created successfully!")
         print(f"   ID: {test_category.id}")
@@ -32,22 +45,21 @@ def test_create():
         
         return test_category.id
     except Exception as e:
-        db.rollback()
         print(f"   ✗ Failed to create category: {str(e)}")
         raise
-    finally:
-        db.close()
 
-def test_read(category_id: int):
+def test_read(db: Session, category_id: int):
     """Test READ operation"""
-    print("\n" + "=" * 60)
+    print(BANNER)
     print("2. READ - Reading category from database...")
-    print("=" * 60)
+    print(SEP)
     
-    db: Session = SessionLocal()
     try:
-        # Read by ID
-        category = db.query(Category).filter(Category.id == category_id).first()
+        # Read by ID and by slug in one query, then tell the rows apart locally
+        categories = db.execute(
+            select(Category).where(or_(Category.id == category_id, Category.slug == "test-category"))
+        ).scalars().all()
+        category = next((row for row in categories if row.id == category_id), None)
         
         if category:
             print(f"   ✓ Category found!")
@@ -57,13 +69,15 @@ def test_read(category_id: int):
             print(f"   Description: {category.description}")
             
             # Also test reading by slug
-            category_by_slug = db.query(Category).filter(Category.slug == "test-category").first()
-            if category_by_slug:
+            if any(row.slug == "test-category" for row in categories):
                 print(f"\n   ✓ Category also found by slug lookup!")
             
-            # Count all categories
-            total_categories = db.query(Category).count()
-            print(f"\n   Total categories in database: {total_categories}")
+            # Planner estimate from pg_class - a catalog lookup instead of a COUNT(*) scan
+            total_categories = db.execute(_ROW_ESTIMATE, {"table": Category.__tablename__}).scalar()
+            if total_categories is not None and total_categories >= 0:
+                print(f"\n   Total categories in database: ~{total_categories} (estimate)")
+            else:
+                print(f"\n   Total categories in database: unknown (table not analyzed yet)")
         else:
             print(f"   ✗ Category with ID {category_id} not found!")
             return False
@@ -72,115 +86,96 @@ def test_read(category_id: int):
     except Exception as e:
         print(f"   ✗ Failed to read category: {str(e)}")
         raise
-    finally:
-        db.close()
 
-def test_update(category_id: int):
+def test_update(db: Session, category_id: int):
     """Test UPDATE operation"""
-    print("\n" + "=" * 60)
+    print(BANNER)
     print("3. UPDATE - Updating category...")
-    print("=" * 60)
+    print(SEP)
     
-    db: Session = SessionLocal()
     try:
-        category = db.query(Category).filter(Category.id == category_id).first()
+        # One UPDATE ... RETURNING round trip instead of read, commit and refresh
+        row = db.execute(
+            update(Category)
+            .where(Category.id == category_id)
+            .values(name="Updated Test Category", description="This category has been updated")
+            .returning(Category.name, Category.description)
+        ).one_or_none()
         
-        if not category:
+        if row is None:
             print(f"   ✗ Category with ID {category_id} not found!")
             return False
         
-        # Update category information
-        old_name = category.name
-        category.name = "Updated Test Category"
-        category.description = "This category has been updated"
-        
-        db.commit()
-        db.refresh(category)
-        
         print(f"   ✓ Category updated successfully!")
-        print(f"   Old name: {old_name}")
-        print(f"   New name: {category.name}")
-        print(f"   New description: {category.description}")
-        print(f"   Updated at: {category.updated_at}")
+        print(f"   New name: {row.name}")
+        print(f"   New description: {row.description}")
         
         return True
     except Exception as e:
-        db.rollback()
         print(f"   ✗ Failed to update category: {str(e)}")
         raise
-    finally:
-        db.close()
 
-def test_delete(category_id: int):
+def test_delete(db: Session, category_id: int):
     """Test DELETE operation"""
-    print("\n" + "=" * 60)
+    print(BANNER)
     print("4. DELETE - Deleting category...")
-    print("=" * 60)
+    print(SEP)
     
-    db: Session = SessionLocal()
     try:
-        category = db.query(Category).filter(Category.id == category_id).first()
+        # RETURNING reports the deleted row, so no read-back SELECT is needed
+        category_name = db.execute(
+            delete(Category).where(Category.id == category_id).returning(Category.name)
+        ).scalar_one_or_none()
         
-        if not category:
+        if category_name is None:
             print(f"   ✗ Category with ID {category_id} not found!")
             return False
         
-        category_name = category.name
-        db.delete(category)
-        db.commit()
-        
-        # Verify deletion
-        deleted_category = db.query(Category).filter(Category.id == category_id).first()
-        if deleted_category is None:
-            print(f"   ✓ Category '{category_name}' deleted successfully!")
-            print(f"   ✓ Verified: Category no longer exists in database")
-        else:
-            print(f"   ✗ Deletion failed - category still exists!")
-            return False
+        print(f"   ✓ Category '{category_name}' deleted successfully!")
+        print(f"   ✓ Verified: DELETE removed exactly one row")
         
         return True
     except Exception as e:
-        db.rollback()
         print(f"   ✗ Failed to delete category: {str(e)}")
         raise
-    finally:
-        db.close()
 
-def test_list_all():
+def test_list_all(db: Session):
     """Test listing all records"""
-    print("\n" + "=" * 60)
+    print(BANNER)
     print("5. LIST - Listing all categories...")
-    print("=" * 60)
+    print(SEP)
     
-    db: Session = SessionLocal()
     try:
-        categories = db.query(Category).all()
+        # Only the printed columns, only the rows the preview needs; the window
+        # count still reports the full table size in the same round trip
+        categories = db.execute(
+            select(Category.id, Category.name, Category.slug, func.count().over().label("total")).limit(5)
+        ).all()
+        total = categories[0].total if categories else 0
         
-        print(f"   ✓ Found {len(categories)} category(ies) in database:")
-        for category in categories[:5]:  # Show first 5
-            print(f"     - ID: {category.id}, Name: {category.name}, Slug: {category.slug}")
+        print(f"   ✓ Found {total} category(ies) in database:")
+        # Show first 5, emitted as one write rather than a print per row
+        if categories:
+            sys.stdout.write("\n".join(
+                f"     - ID: {category.id}, Name: {category.name}, Slug: {category.slug}" for category in categories[:5]
+            ) + "\n")
         
-        if len(categories) > 5:
-            print(f"     ... and {len(categories) - 5} more")
+        if total > 5:
+            print(f"     ... and {total - 5} more")
         
         return True
     except Exception as e:
         print(f"   ✗ Failed to list categories: {str(e)}")
         raise
-    finally:
-        db.close()
 
-def check_tables_exist():
+def check_tables_exist(db: Session):
     """Check if required tables exist"""
-    print("\n" + "=" * 60)
+    print(BANNER)
     print("0. PREREQUISITE - Checking if tables exist...")
-    print("=" * 60)
+    print(SEP)
     
-    db: Session = SessionLocal()
     try:
-        from sqlalchemy import inspect
-        inspector = inspect(db.get_bind())
-        tables = inspector.get_table_names()
+        tables = _table_set(db.get_bind())
         
         if 'categories' in tables:
             print(f"   ✓ 'categories' table exists")
@@ -188,77 +183,78 @@ def check_tables_exist():
             return True
         else:
             print(f"   ✗ 'categories' table does not exist!")
-            print(f"   Available tables: {', '.join(tables) if tables else 'None'}")
+            print(f"   Available tables: {', '.join(sorted(tables)) if tables else 'None'}")
             print(f"\n   Please run migrations first:")
             print(f"   alembic upgrade head")
             return False
     except Exception as e:
         print(f"   ✗ Error checking tables: {str(e)}")
         return False
-    finally:
-        db.close()
 
 def main():
     """Run all CRUD tests"""
-    print("\n" + "=" * 60)
+    print(BANNER)
     print("CRUD TEST - Category Model")
-    print("=" * 60)
+    print(SEP)
     print(f"\nDatabase: {settings.DB_NAME}")
     print(f"Host: {settings.DB_HOST}")
     
-    try:
-        # Check if tables exist first
-        if not check_tables_exist():
-            print("\n✗ Tables not found. Please run migrations first!")
-            print("   Command: alembic upgrade head")
+    # Every step runs inside one transaction, committed once when the block
+    # exits; an exception (or sys.exit) rolls the whole sequence back, and a
+    # failed step rolls back before returning so a partial run is never kept.
+    # expire_on_commit=False keeps loaded objects usable after that commit
+    with SessionLocal(expire_on_commit=False) as db, db.begin():
+        try:
+            # Check if tables exist first
+            if not check_tables_exist(db):
+                print("\n✗ Tables not found. Please run migrations first!")
+                print("   Command: alembic upgrade head")
+                sys.exit(1)
+            
+            # Test CREATE
+            category_id = test_create(db)
+            
+            # Test READ
+            if not test_read(db, category_id):
+                print("\n✗ Read test failed, skipping remaining tests")
+                db.rollback()
+                return
+            
+            # Test UPDATE
+            if not test_update(db, category_id):
+                print("\n✗ Update test failed, skipping delete test")
+                db.rollback()
+                return
+            
+            # Test LIST
+            test_list_all(db)
+            
+            # Test DELETE
+            if not test_delete(db, category_id):
+                print("\n✗ Delete test failed")
+                db.rollback()
+                return
+            
+            # Final verification
+            print(BANNER)
+            print("✓ ALL CRUD OPERATIONS PASSED!")
+            print(SEP)
+            print("\nSummary:")
+            print("  ✓ CREATE - Category created successfully")
+            print("  ✓ READ   - Category retrieved successfully")
+            print("  ✓ UPDATE - Category updated successfully")
+            print("  ✓ DELETE - Category deleted successfully")
+            print("  ✓ LIST   - Categories listed successfully")
+            print(BANNER, end="\n\n")
+            
+        except Exception as e:
+            print(BANNER)
+            print("✗ CRUD TEST FAILED")
+            print(SEP)
+            print(f"Error: {str(e)}")
+            import traceback
+            traceback.print_exc()
             sys.exit(1)
-        
-        # Test CREATE
-        category_id = test_create()
-        
-        # Test READ
-        if not test_read(category_id):
-            print("\n✗ Read test failed, skipping remaining tests")
-            return
-        
-        # Test UPDATE
-        if not test_update(category_id):
-            print("\n✗ Update test failed, skipping delete test")
-            return
-        
-        # Test READ again to verify update
-        print("\n" + "-" * 60)
-        print("Verifying update by reading again...")
-        test_read(category_id)
-        
-        # Test LIST
-        test_list_all()
-        
-        # Test DELETE
-        if not test_delete(category_id):
-            print("\n✗ Delete test failed")
-            return
-        
-        # Final verification
-        print("\n" + "=" * 60)
-        print("✓ ALL CRUD OPERATIONS PASSED!")
-        print("=" * 60)
-        print("\nSummary:")
-        print("  ✓ CREATE - Category created successfully")
-        print("  ✓ READ   - Category retrieved successfully")
-        print("  ✓ UPDATE - Category updated successfully")
-        print("  ✓ DELETE - Category deleted successfully")
-        print("  ✓ LIST   - Categories listed successfully")
-        print("\n" + "=" * 60 + "\n")
-        
-    except Exception as e:
-        print("\n" + "=" * 60)
-        print("✗ CRUD TEST FAILED")
-        print("=" * 60)
-        print(f"Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
 
 if __name__ == "__main__":
     main()